@@ -1,584 +1,746 @@
-import streamlit as st
-import pandas as pd
-from datetime import datetime
-from collections import Counter
-import hashlib
-import matplotlib.pyplot as plt
-import plotly.express as px
-import plotly.graph_objects as go
-import time
-
-# Set page config
-st.set_page_config(
-    page_title="Data Validator",
-    page_icon="📊",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# ------------------ Simple CSS ------------------
-st.markdown("""
-<style>
-    /* Clean styling */
-    .main-header {
-        background: #1E88E5;
-        padding: 1.5rem;
-        border-radius: 10px;
-        color: white;
-        margin-bottom: 1rem;
-    }
-    
-    .metric-card {
-        background: white;
-        padding: 1rem;
-        border-radius: 10px;
-        border: 1px solid #ddd;
-        box-shadow: 0 2px 5px rgba(0,0,0,0.05);
-    }
-    
-    .stButton > button {
-        background: #1E88E5;
-        color: white;
-        border: none;
-        padding: 0.5rem 1.5rem;
-        border-radius: 5px;
-        font-weight: 500;
-    }
-    
-    .stButton > button:hover {
-        background: #1976D2;
-    }
-    
-    /* Tab styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2rem;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        padding: 10px 20px;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# ------------------ Utility Functions (UNCHANGED) ------------------
-
-def calculate_checksum(file_bytes):
-    return hashlib.md5(file_bytes).hexdigest()
-
-def validate_date(value):
-    formats = ["%d/%m/%Y", "%m-%d-%Y"]
-    for fmt in formats:
-        try:
-            datetime.strptime(str(value), fmt)
-            return True
-        except:
-            pass
-    return False
-
-def validate_row(row, seen_ids):
-    errors = []
-
-    # order_id
-    if pd.isna(row.get("order_id")):
-        errors.append("Missing order_id")
-    else:
-        if row["order_id"] in seen_ids:
-            errors.append("Duplicate order_id")
-        seen_ids.add(row["order_id"])
-
-    # item
-    if pd.isna(row.get("item")) or str(row.get("item")).strip() == "":
-        errors.append("Missing item")
-
-    # date
-    if pd.isna(row.get("date")) or not validate_date(row["date"]):
-        errors.append("Invalid date (dd/mm/yyyy or mm-dd-yyyy)")
-
-    # quantity
-    try:
-        qty = int(row.get("quantity"))
-        if qty < 0:
-            errors.append("Negative quantity")
-    except:
-        errors.append("Invalid quantity")
-
-    # price
-    try:
-        price = float(row.get("price"))
-        if price < 0:
-            errors.append("Negative price")
-    except:
-        errors.append("Invalid price")
-
-    if errors:
-        return "Invalid", "; ".join(errors)
-    return "Valid", "No errors"
-
-# ------------------ Sidebar ------------------
-
-with st.sidebar:
-    st.title("📊 Data Validator")
-    st.markdown("---")
-    
-    # File upload
-    uploaded_file = st.file_uploader(
-        "Upload CSV/Excel File",
-        type=["csv", "xlsx"],
-        help="Upload file with columns: order_id, date, item, quantity, price"
-    )
-    
-    if uploaded_file:
-        st.markdown("---")
-        st.markdown("**File Info:**")
-        st.text(f"Name: {uploaded_file.name}")
-        st.text(f"Type: {uploaded_file.type}")
-        
-        # Navigation
-        st.markdown("---")
-        st.markdown("**Navigation**")
-        page = st.radio(
-            "Go to:",
-            ["📋 Preview", "📊 Dashboard", "❗ Errors", "⬇️ Export"],
-            label_visibility="collapsed"
-        )
-    else:
-        page = None
-
-# ------------------ Main Content ------------------
-
-if uploaded_file:
-    # Read file
-    file_bytes = uploaded_file.getvalue()
-    checksum = calculate_checksum(file_bytes)
-
-    try:
-        if uploaded_file.name.endswith(".csv"):
-            df = pd.read_csv(uploaded_file)
-        else:
-            df = pd.read_excel(uploaded_file)
-    except Exception as e:
-        st.error(f"Failed to read file: {e}")
-        st.stop()
-
-    # Check required columns
-    required_cols = ["order_id", "date", "item", "quantity", "price"]
-    if not all(col in df.columns for col in required_cols):
-        missing = [col for col in required_cols if col not in df.columns]
-        st.error(f"Missing columns: {', '.join(missing)}")
-        st.stop()
-
-    # Validation
-    st.info("🔄 Validating data...")
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
-    seen_ids = set()
-    statuses, messages = [], []
-    
-    for i, (_, row) in enumerate(df.iterrows()):
-        status, msg = validate_row(row, seen_ids)
-        statuses.append(status)
-        messages.append(msg)
-        progress = (i + 1) / len(df)
-        progress_bar.progress(progress)
-        status_text.text(f"Processing: {i + 1}/{len(df)} rows")
-    
-    progress_bar.empty()
-    status_text.text("✅ Validation complete!")
-    
-    df["status"] = statuses
-    df["error_message"] = messages
-
-    # Calculate stats
-    total = len(df)
-    valid = (df["status"] == "Valid").sum()
-    invalid = (df["status"] == "Invalid").sum()
-    validation_rate = (valid / total * 100) if total > 0 else 0
-
-    # Update sidebar info
-    with st.sidebar:
-        st.markdown("---")
-        st.markdown("**Validation Stats**")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Total", total)
-            st.metric("Valid", valid)
-        with col2:
-            st.metric("Invalid", invalid)
-            st.metric("Rate", f"{validation_rate:.1f}%")
-
-    # ------------------ PAGE 1: Preview ------------------
-    if page == "📋 Preview":
-        st.markdown('<div class="main-header">', unsafe_allow_html=True)
-        st.markdown("## 📋 Data Preview")
-        st.markdown("</div>", unsafe_allow_html=True)
-        
-        # Quick stats
-        col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Total Rows", total)
-        col2.metric("Valid", valid)
-        col3.metric("Invalid", invalid)
-        col4.metric("Success Rate", f"{validation_rate:.1f}%")
-        
-        # Filters
-        st.markdown("---")
-        col1, col2 = st.columns(2)
-        with col1:
-            filter_option = st.selectbox(
-                "Show:",
-                ["All rows", "Valid only", "Invalid only"]
-            )
-        with col2:
-            rows_to_show = st.slider("Rows to display", 10, 100, 20)
-        
-        # Apply filter
-        if filter_option == "Valid only":
-            preview_df = df[df["status"] == "Valid"]
-        elif filter_option == "Invalid only":
-            preview_df = df[df["status"] == "Invalid"]
-        else:
-            preview_df = df
-        
-        # Display data - FIXED THE ERROR HERE
-        st.dataframe(
-            preview_df.head(rows_to_show),
-            use_container_width=True,
-            height=400
-        )
-        
-        # Row details
-        if not preview_df.empty:
-            st.markdown("---")
-            st.markdown("### 🔍 Row Details")
-            selected_index = st.selectbox(
-                "Select row to inspect:",
-                range(len(preview_df.head(20))),
-                format_func=lambda x: f"Row {x+1}"
-            )
-            
-            if 0 <= selected_index < len(preview_df):
-                row_data = preview_df.iloc[selected_index]
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write("**Data:**")
-                    for col in required_cols:
-                        st.text(f"{col}: {row_data[col]}")
-                with col2:
-                    st.write("**Status:**")
-                    if row_data["status"] == "Valid":
-                        st.success("✅ Valid")
-                    else:
-                        st.error(f"❌ {row_data['error_message']}")
-
-    # ------------------ PAGE 2: Dashboard ------------------
-    elif page == "📊 Dashboard":
-        st.markdown('<div class="main-header">', unsafe_allow_html=True)
-        st.markdown("## 📊 Analytics Dashboard")
-        st.markdown("</div>", unsafe_allow_html=True)
-        
-        # Metrics
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("📊 Total Data", total)
-        with col2:
-            st.metric("✅ Clean Data", valid, f"{validation_rate:.1f}%")
-        with col3:
-            st.metric("❌ Issues Found", invalid)
-        
-        # Charts in tabs
-        tab1, tab2 = st.tabs(["Validation Overview", "Error Analysis"])
-        
-        with tab1:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Pie chart
-                fig = px.pie(
-                    names=['Valid', 'Invalid'],
-                    values=[valid, invalid],
-                    title="Data Quality",
-                    color=['Valid', 'Invalid'],
-                    color_discrete_map={'Valid': '#00C853', 'Invalid': '#FF5252'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                # Bar chart
-                fig = go.Figure(data=[
-                    go.Bar(
-                        name='Valid',
-                        x=['Status'],
-                        y=[valid],
-                        marker_color='#00C853'
-                    ),
-                    go.Bar(
-                        name='Invalid',
-                        x=['Status'],
-                        y=[invalid],
-                        marker_color='#FF5252'
-                    )
-                ])
-                fig.update_layout(title="Validation Results", barmode='stack')
-                st.plotly_chart(fig, use_container_width=True)
-        
-        with tab2:
-            # Error analysis
-            error_list = []
-            for msg in df[df["status"] == "Invalid"]["error_message"]:
-                error_list.extend(msg.split("; "))
-            
-            if error_list:
-                error_counts = Counter(error_list)
-                error_df = pd.DataFrame({
-                    'Error': list(error_counts.keys()),
-                    'Count': list(error_counts.values())
-                }).sort_values('Count', ascending=False)
-                
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    fig = px.bar(
-                        error_df,
-                        x='Error',
-                        y='Count',
-                        title="Error Types",
-                        color='Count',
-                        color_continuous_scale='Reds'
-                    )
-                    fig.update_layout(xaxis_tickangle=-45)
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    st.dataframe(error_df, use_container_width=True)
-            else:
-                st.success("🎉 No errors found!")
-        
-        # Data summary
-        st.markdown("---")
-        st.markdown("### 📈 Data Summary")
-        
-        summary_cols = ['quantity', 'price']
-        for col in summary_cols:
-            if col in df.columns:
-                try:
-                    numeric_data = pd.to_numeric(df[col], errors='coerce')
-                    col1, col2, col3, col4 = st.columns(4)
-                    col1.metric(f"{col} - Mean", f"{numeric_data.mean():.2f}")
-                    col2.metric(f"{col} - Median", f"{numeric_data.median():.2f}")
-                    col3.metric(f"{col} - Min", f"{numeric_data.min():.2f}")
-                    col4.metric(f"{col} - Max", f"{numeric_data.max():.2f}")
-                except:
-                    pass
-
-    # ------------------ PAGE 3: Errors ------------------
-    elif page == "❗ Errors":
-        st.markdown('<div class="main-header">', unsafe_allow_html=True)
-        st.markdown("## ❌ Error Analysis")
-        st.markdown("</div>", unsafe_allow_html=True)
-        
-        invalid_df = df[df["status"] == "Invalid"]
-        
-        if invalid_df.empty:
-            st.success("✅ All data is valid! No errors found.")
-        else:
-            # Error summary
-            st.metric("Total Errors Found", len(invalid_df))
-            
-            # Error type filter
-            all_errors = []
-            for msg in invalid_df['error_message']:
-                all_errors.extend(msg.split('; '))
-            
-            unique_errors = sorted(set(all_errors))
-            
-            selected_errors = st.multiselect(
-                "Filter by error type:",
-                options=unique_errors,
-                default=unique_errors[:2] if len(unique_errors) > 1 else unique_errors
-            )
-            
-            # Apply filter
-            if selected_errors:
-                filtered_df = invalid_df[
-                    invalid_df['error_message'].apply(
-                        lambda x: any(err in x for err in selected_errors)
-                    )
-                ]
-            else:
-                filtered_df = invalid_df
-            
-            # Display errors
-            st.dataframe(
-                filtered_df,
-                use_container_width=True,
-                height=400
-            )
-            
-            # Error details
-            st.markdown("---")
-            st.markdown("### 📋 Error Breakdown")
-            
-            error_details = []
-            for _, row in filtered_df.iterrows():
-                for error in row['error_message'].split('; '):
-                    error_details.append({
-                        'Row': _,
-                        'Error': error
-                    })
-            
-            if error_details:
-                error_summary = pd.DataFrame(error_details)
-                error_counts = error_summary['Error'].value_counts()
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write("**Error Frequency:**")
-                    for error, count in error_counts.items():
-                        st.write(f"• {error}: {count} times")
-                with col2:
-                    st.write("**Quick Fixes:**")
-                    for error in error_counts.index[:3]:  # Top 3 errors
-                        if "Missing" in error:
-                            st.write(f"• Fill in missing values")
-                        elif "Duplicate" in error:
-                            st.write(f"• Remove duplicate entries")
-                        elif "Invalid date" in error:
-                            st.write(f"• Use dd/mm/yyyy or mm-dd-yyyy format")
-
-    # ------------------ PAGE 4: Export ------------------
-    elif page == "⬇️ Export":
-        st.markdown('<div class="main-header">', unsafe_allow_html=True)
-        st.markdown("## 📥 Export Results")
-        st.markdown("</div>", unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### 📁 Export Options")
-            
-            # Format selection
-            export_format = st.radio(
-                "Select format:",
-                ["CSV", "Excel"],
-                horizontal=True
-            )
-            
-            # What to export
-            export_option = st.radio(
-                "Export:",
-                ["All data", "Valid only", "Invalid only"]
-            )
-            
-            # Filter data
-            if export_option == "Valid only":
-                export_df = df[df["status"] == "Valid"]
-            elif export_option == "Invalid only":
-                export_df = df[df["status"] == "Invalid"]
-            else:
-                export_df = df
-            
-            # File name
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_name = f"validated_data_{timestamp}"
-            export_name = st.text_input("File name:", value=default_name)
-        
-        with col2:
-            st.markdown("### 📊 Export Preview")
-            
-            # Preview
-            st.dataframe(export_df.head(5), use_container_width=True)
-            
-            # Stats
-            st.markdown("---")
-            st.markdown("**Export Summary:**")
-            st.write(f"• Rows: {len(export_df)}")
-            st.write(f"• Columns: {len(export_df.columns)}")
-            st.write(f"• Format: {export_format}")
-        
-        # Download buttons
-        st.markdown("---")
-        
-        if export_format == "CSV":
-            csv_data = export_df.to_csv(index=False).encode("utf-8")
-            st.download_button(
-                label="📥 Download CSV",
-                data=csv_data,
-                file_name=f"{export_name}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
-        else:
-            # Excel export
-            import io
-            buffer = io.BytesIO()
-            with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                export_df.to_excel(writer, index=False, sheet_name='Validated Data')
-            
-            st.download_button(
-                label="📥 Download Excel",
-                data=buffer.getvalue(),
-                file_name=f"{export_name}.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                use_container_width=True
-            )
-        
-        # Additional options
-        with st.expander("⚙️ Advanced Options"):
-            col1, col2 = st.columns(2)
-            with col1:
-                include_status = st.checkbox("Include validation status", value=True)
-                include_errors = st.checkbox("Include error messages", value=True)
-            with col2:
-                st.info("Note: Export may take a moment for large files")
-
-else:
-    # Landing page when no file is uploaded
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        st.markdown('<div class="main-header">', unsafe_allow_html=True)
-        st.markdown("# 📊 Data Validator Tool")
-        st.markdown("</div>", unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # Simple instructions
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("### 🚀 How to Use:")
-        st.markdown("""
-        1. **Upload** your CSV/Excel file
-        2. **Preview** your data
-        3. **Analyze** validation results
-        4. **Export** cleaned data
-        """)
-    
-    with col2:
-        st.markdown("### 📋 Requirements:")
-        st.markdown("""
-        Your file must include:
-        - `order_id` (unique)
-        - `date` (dd/mm/yyyy or mm-dd-yyyy)
-        - `item` (text)
-        - `quantity` (number)
-        - `price` (number)
-        """)
-    
-    st.markdown("---")
-    
-    # Quick tips
-    with st.expander("💡 Tips for Best Results"):
-        st.markdown("""
-        - Ensure dates are in correct format
-        - Check for duplicate order IDs
-        - Verify all required fields are filled
-        - Use consistent number formats
-        - Save as CSV for best compatibility
-        """)
-    
-    # Empty state visualization
-    st.markdown("")
-    col1, col2, col3 = st.columns(3)
-    with col2:
+import streamlit as st
+import pandas as pd
+import numpy as np
+from datetime import datetime
+import concurrent.futures
+import hashlib
+import io
+import os
+import re
+import matplotlib.pyplot as plt
+import plotly.express as px
+import plotly.graph_objects as go
+import time
+
+# Set page config
+st.set_page_config(
+    page_title="Data Validator",
+    page_icon="📊",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# ------------------ Simple CSS ------------------
+st.markdown("""
+<style>
+    /* Clean styling */
+    .main-header {
+        background: #1E88E5;
+        padding: 1.5rem;
+        border-radius: 10px;
+        color: white;
+        margin-bottom: 1rem;
+    }
+    
+    .metric-card {
+        background: white;
+        padding: 1rem;
+        border-radius: 10px;
+        border: 1px solid #ddd;
+        box-shadow: 0 2px 5px rgba(0,0,0,0.05);
+    }
+    
+    .stButton > button {
+        background: #1E88E5;
+        color: white;
+        border: none;
+        padding: 0.5rem 1.5rem;
+        border-radius: 5px;
+        font-weight: 500;
+    }
+    
+    .stButton > button:hover {
+        background: #1976D2;
+    }
+    
+    /* Tab styling */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 2rem;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        padding: 10px 20px;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+# ------------------ Utility Functions ------------------
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+REQUIRED_COLS = ["order_id", "date", "item", "quantity", "price"]
+
+# One message per rule, in the order the flag rows come back from the
+# validators below.
+CHECK_MESSAGES = [
+    "Missing order_id",
+    "Duplicate order_id",
+    "Missing item",
+    "Invalid date (dd/mm/yyyy or mm-dd-yyyy)",
+    "Negative quantity",
+    "Invalid quantity",
+    "Negative price",
+    "Invalid price",
+]
+
+if njit is not None:
+    @njit(cache=True)
+    def _validate_rows(id_codes, item_missing, date_bad, qty, price):
+        """Fused single pass over contiguous row arrays.
+
+        One tight loop replaces eight separate mask passes, and duplicate
+        detection runs against the factorized id codes (a plain int array
+        lookup) instead of a Python set. Compiled once per process.
+        """
+        n = id_codes.shape[0]
+        flags = np.zeros((8, n), dtype=np.bool_)
+        if n == 0:
+            return flags
+        seen = np.zeros(id_codes.max() + 2, dtype=np.bool_)
+        for i in range(n):
+            code = id_codes[i]
+            if code < 0:
+                flags[0, i] = True
+            elif seen[code]:
+                flags[1, i] = True
+            else:
+                seen[code] = True
+            if item_missing[i]:
+                flags[2, i] = True
+            if date_bad[i]:
+                flags[3, i] = True
+            q = qty[i]
+            if q != q:
+                flags[5, i] = True
+            elif q < 0:
+                flags[4, i] = True
+            p = price[i]
+            if p != p:
+                flags[7, i] = True
+            elif p < 0:
+                flags[6, i] = True
+        return flags
+else:
+    _validate_rows = None
+
+# Shard validation across processes above this row count; below it the
+# fork/pickle overhead costs more than it saves
+PARALLEL_THRESHOLD = 200_000
+
+def _row_features(df):
+    """Per-row rule inputs: item/date masks plus numeric quantity/price
+    (NaN where unparseable)."""
+    missing_item = df["item"].isna() | df["item"].astype(str).str.strip().eq("")
+    d1 = pd.to_datetime(df["date"], format="%d/%m/%Y", errors="coerce")
+    d2 = pd.to_datetime(df["date"], format="%m-%d-%Y", errors="coerce")
+    bad_date = df["date"].isna() | (d1.isna() & d2.isna())
+    qty = pd.to_numeric(df["quantity"], errors="coerce").to_numpy(dtype=np.float64)
+    price = pd.to_numeric(df["price"], errors="coerce").to_numpy(dtype=np.float64)
+    return missing_item.to_numpy(), bad_date.to_numpy(), qty, price
+
+def _row_rule_masks(df):
+    """The six per-row rule masks for one shard of the frame, in
+    CHECK_MESSAGES order (order_id rules excluded — they are global)."""
+    missing_item, bad_date, qty, price = _row_features(df)
+    return [
+        missing_item, bad_date,
+        qty < 0, np.isnan(qty),
+        price < 0, np.isnan(price),
+    ]
+
+@st.cache_data(show_spinner=False)
+def calculate_checksum(file_bytes):
+    # Only used as a cache key, so a fast non-cryptographic hash is fine;
+    # xxh3 is ~10x quicker than md5 on big uploads, blake2b ~2x
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(file_bytes)
+    return hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+
+@st.cache_data(show_spinner=False)
+def load_and_validate(file_bytes, filename):
+    """Parse the uploaded bytes and return the validated DataFrame.
+
+    Cached on file content, so widget reruns and re-uploads of the same
+    file skip both the parse and the validation entirely.
+    """
+    try:
+        if filename.endswith(".csv"):
+            # pyarrow parses CSV multi-threaded; declaring every column as
+            # string skips dtype inference and keeps order_id leading zeros
+            # intact (the validators coerce to numeric themselves).
+            try:
+                df = pd.read_csv(
+                    io.BytesIO(file_bytes),
+                    engine="pyarrow",
+                    dtype_backend="pyarrow",
+                    dtype={col: "string" for col in REQUIRED_COLS},
+                )
+            except ImportError:
+                df = pd.read_csv(io.BytesIO(file_bytes))
+        else:
+            # calamine (Rust) parses xlsx ~2x faster than openpyxl
+            try:
+                df = pd.read_excel(io.BytesIO(file_bytes), engine="calamine")
+            except ImportError:
+                df = pd.read_excel(io.BytesIO(file_bytes))
+    except Exception as e:
+        raise ValueError(f"Failed to read file: {e}")
+
+    missing = [col for col in REQUIRED_COLS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    # Validation: one boolean mask per rule, in CHECK_MESSAGES order
+    if len(df) > PARALLEL_THRESHOLD:
+        # order_id uniqueness is global, so compute its masks once in the
+        # parent; only the per-row rules shard cleanly across workers
+        missing_id = df["order_id"].isna()
+        dup_id = df["order_id"].duplicated(keep="first") & ~missing_id
+        n_workers = min(os.cpu_count() or 1, max(1, len(df) // 100_000))
+        # split positionally: np.array_split on a DataFrame coerces it to
+        # an ndarray on pandas 3 (swapaxes removal), crashing the workers
+        bounds = np.linspace(0, len(df), n_workers + 1, dtype=int)
+        chunks = [
+            df[REQUIRED_COLS].iloc[lo:hi]
+            for lo, hi in zip(bounds[:-1], bounds[1:])
+        ]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(_row_rule_masks, chunks))
+        masks = [missing_id.to_numpy(), dup_id.to_numpy()]
+        masks += [np.concatenate(parts) for parts in zip(*results)]
+    elif _validate_rows is not None:
+        # factorize maps each order_id to an int code (-1 for NaN), which
+        # is what the jitted kernel dedups against
+        id_codes = pd.factorize(df["order_id"])[0]
+        flags = _validate_rows(id_codes, *_row_features(df))
+        masks = list(flags)
+    else:
+        missing_id = df["order_id"].isna()
+        dup_id = df["order_id"].duplicated(keep="first") & ~missing_id
+        masks = [missing_id.to_numpy(), dup_id.to_numpy()] + _row_rule_masks(df)
+
+    error_message = np.full(len(df), "", dtype=object)
+    any_error = np.zeros(len(df), dtype=bool)
+    for mask, msg in zip(masks, CHECK_MESSAGES):
+        any_error |= mask
+        error_message = np.where(mask, error_message + (msg + "; "), error_message)
+
+    messages = pd.Series(error_message, index=df.index).str.rstrip("; ")
+
+    # status is two distinct strings repeated per row; categorical storage
+    # keeps an int code array instead of a PyObject string per row, so
+    # later comparisons and value_counts stay cheap. error_message stays
+    # plain strings: .str.split on a categorical misbehaves on pandas 3,
+    # breaking every explode() consumer downstream.
+    df["status"] = pd.Categorical(
+        np.where(any_error, "Invalid", "Valid"),
+        categories=["Valid", "Invalid"]
+    )
+    df["error_message"] = messages.where(any_error, "No errors")
+    return df
+
+@st.cache_data(show_spinner=False)
+def build_error_df(checksum, _messages):
+    """Aggregate error messages into an Error/Count table, cached per file."""
+    error_counts = _messages.str.split("; ").explode().value_counts()
+    error_df = error_counts.reset_index()
+    error_df.columns = ["Error", "Count"]
+    return error_df
+
+@st.cache_data(show_spinner=False)
+def build_quality_pie(valid, invalid):
+    """Dashboard pie; figures pickle cleanly so caching skips rebuilds."""
+    return px.pie(
+        names=['Valid', 'Invalid'],
+        values=[valid, invalid],
+        title="Data Quality",
+        color=['Valid', 'Invalid'],
+        color_discrete_map={'Valid': '#00C853', 'Invalid': '#FF5252'}
+    )
+
+@st.cache_data(show_spinner=False)
+def build_status_bar(valid, invalid):
+    fig = go.Figure(data=[
+        go.Bar(
+            name='Valid',
+            x=['Status'],
+            y=[valid],
+            marker_color='#00C853'
+        ),
+        go.Bar(
+            name='Invalid',
+            x=['Status'],
+            y=[invalid],
+            marker_color='#FF5252'
+        )
+    ])
+    fig.update_layout(title="Validation Results", barmode='stack')
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_error_bar(checksum, _error_df):
+    fig = px.bar(
+        _error_df,
+        x='Error',
+        y='Count',
+        title="Error Types",
+        color='Count',
+        color_continuous_scale='Reds'
+    )
+    # uirevision lets the front end reuse the existing chart DOM on reruns
+    fig.update_layout(xaxis_tickangle=-45, uirevision="fixed")
+    return fig
+
+@st.cache_data(show_spinner=False)
+def summarize_column(checksum, col, _values):
+    """Mean/median/min/max in one agg call instead of four full scans."""
+    numeric_data = pd.to_numeric(_values, errors='coerce').astype(np.float32)
+    return numeric_data.agg(['mean', 'median', 'min', 'max'])
+
+@st.cache_data(show_spinner=False)
+def build_export_payload(checksum, export_option, fmt, _df):
+    """Serialize the export slice once per (file, option, format) combo."""
+    if fmt == "CSV":
+        return _df.to_csv(index=False).encode("utf-8")
+    # Excel export (xlsxwriter in constant_memory mode streams rows
+    # straight to the zip instead of building a cell object per value)
+    buffer = io.BytesIO()
+    try:
+        with pd.ExcelWriter(
+            buffer,
+            engine='xlsxwriter',
+            engine_kwargs={'options': {'constant_memory': True}}
+        ) as writer:
+            _df.to_excel(writer, index=False, sheet_name='Validated Data')
+    except ImportError:
+        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+            _df.to_excel(writer, index=False, sheet_name='Validated Data')
+    return buffer.getvalue()
+
+# ------------------ Sidebar ------------------
+
+with st.sidebar:
+    st.title("📊 Data Validator")
+    st.markdown("---")
+    
+    # File upload
+    uploaded_file = st.file_uploader(
+        "Upload CSV/Excel File",
+        type=["csv", "xlsx"],
+        help="Upload file with columns: order_id, date, item, quantity, price"
+    )
+    
+    if uploaded_file:
+        st.markdown("---")
+        st.markdown("**File Info:**")
+        st.text(f"Name: {uploaded_file.name}")
+        st.text(f"Type: {uploaded_file.type}")
+        
+        # Navigation
+        st.markdown("---")
+        st.markdown("**Navigation**")
+        page = st.radio(
+            "Go to:",
+            ["📋 Preview", "📊 Dashboard", "❗ Errors", "⬇️ Export"],
+            label_visibility="collapsed"
+        )
+    else:
+        page = None
+
+# ------------------ Main Content ------------------
+
+if uploaded_file:
+    # Read file once per upload; getvalue() copies the whole buffer, so
+    # stash the bytes in session_state instead of re-copying on every rerun.
+    # file_id is unique per upload record (name+size would serve stale bytes
+    # when a corrected file happens to match both) but stable across reruns
+    file_key = uploaded_file.file_id
+    if st.session_state.get("_file_key") != file_key:
+        st.session_state["_file_bytes"] = uploaded_file.getvalue()
+        st.session_state["_file_key"] = file_key
+    file_bytes = st.session_state["_file_bytes"]
+    checksum = calculate_checksum(file_bytes)
+
+    # Validation (parse + validate are cached on file content, so widget
+    # reruns skip straight to the cached result). No per-row progress
+    # updates: each one costs a websocket round-trip and a front-end
+    # rerender, which dwarfs the validation itself on large files.
+    try:
+        with st.spinner("🔄 Validating data..."):
+            df = load_and_validate(file_bytes, uploaded_file.name)
+    except ValueError as e:
+        st.error(str(e))
+        st.stop()
+
+    required_cols = REQUIRED_COLS
+
+    # Calculate stats once; every page reuses these instead of re-scanning
+    # the status column per widget rerun
+    total = len(df)
+    # comparing the Series keeps the categorical int8-code fast path;
+    # to_numpy() first would fall back to per-element string compares
+    valid_mask = (df["status"] == "Valid").to_numpy()
+    invalid_mask = ~valid_mask
+    valid_df = df.loc[valid_mask]
+    invalid_df = df.loc[invalid_mask]
+    valid = int(valid_mask.sum())
+    invalid = total - valid
+    validation_rate = (valid / total * 100) if total > 0 else 0
+
+    # Update sidebar info
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown("**Validation Stats**")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total", total)
+            st.metric("Valid", valid)
+        with col2:
+            st.metric("Invalid", invalid)
+            st.metric("Rate", f"{validation_rate:.1f}%")
+
+    # ------------------ PAGE 1: Preview ------------------
+    if page == "📋 Preview":
+        st.markdown('<div class="main-header">', unsafe_allow_html=True)
+        st.markdown("## 📋 Data Preview")
+        st.markdown("</div>", unsafe_allow_html=True)
+        
+        # Quick stats
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Total Rows", total)
+        col2.metric("Valid", valid)
+        col3.metric("Invalid", invalid)
+        col4.metric("Success Rate", f"{validation_rate:.1f}%")
+        
+        # Filters
+        st.markdown("---")
+        col1, col2 = st.columns(2)
+        with col1:
+            filter_option = st.selectbox(
+                "Show:",
+                ["All rows", "Valid only", "Invalid only"]
+            )
+        with col2:
+            rows_to_show = st.slider("Rows to display", 10, 100, 20)
+        
+        # Apply filter
+        if filter_option == "Valid only":
+            preview_df = valid_df
+        elif filter_option == "Invalid only":
+            preview_df = invalid_df
+        else:
+            preview_df = df
+        
+        # Display data - FIXED THE ERROR HERE
+        st.dataframe(
+            preview_df.head(rows_to_show),
+            use_container_width=True,
+            height=400
+        )
+        
+        # Row details
+        if not preview_df.empty:
+            st.markdown("---")
+            st.markdown("### 🔍 Row Details")
+            # number_input is O(1) regardless of row count; the old selectbox
+            # rebuilt a "Row N" label per option on every rerun
+            max_row = min(rows_to_show, len(preview_df))
+            selected_row = st.number_input(
+                "Select row to inspect:",
+                min_value=1,
+                max_value=max_row,
+                value=1
+            )
+
+            if 1 <= selected_row <= len(preview_df):
+                row_data = preview_df.iloc[selected_row - 1]
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write("**Data:**")
+                    for col in required_cols:
+                        st.text(f"{col}: {row_data[col]}")
+                with col2:
+                    st.write("**Status:**")
+                    if row_data["status"] == "Valid":
+                        st.success("✅ Valid")
+                    else:
+                        st.error(f"❌ {row_data['error_message']}")
+
+    # ------------------ PAGE 2: Dashboard ------------------
+    elif page == "📊 Dashboard":
+        st.markdown('<div class="main-header">', unsafe_allow_html=True)
+        st.markdown("## 📊 Analytics Dashboard")
+        st.markdown("</div>", unsafe_allow_html=True)
+        
+        # Metrics
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("📊 Total Data", total)
+        with col2:
+            st.metric("✅ Clean Data", valid, f"{validation_rate:.1f}%")
+        with col3:
+            st.metric("❌ Issues Found", invalid)
+        
+        # Charts in tabs
+        tab1, tab2 = st.tabs(["Validation Overview", "Error Analysis"])
+        
+        with tab1:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Pie chart (cached; staticPlot skips plotly.js event binding)
+                st.plotly_chart(
+                    build_quality_pie(valid, invalid),
+                    use_container_width=True,
+                    config={"staticPlot": True}
+                )
+
+            with col2:
+                # Bar chart
+                st.plotly_chart(
+                    build_status_bar(valid, invalid),
+                    use_container_width=True,
+                    config={"staticPlot": True}
+                )
+        
+        with tab2:
+            # Error analysis (cached per file so tab switches don't recount)
+            error_df = build_error_df(checksum, invalid_df["error_message"])
+
+            if not error_df.empty:
+                col1, col2 = st.columns([2, 1])
+                
+                with col1:
+                    st.plotly_chart(
+                        build_error_bar(checksum, error_df),
+                        use_container_width=True
+                    )
+                
+                with col2:
+                    st.dataframe(error_df, use_container_width=True)
+            else:
+                st.success("🎉 No errors found!")
+        
+        # Data summary
+        st.markdown("---")
+        st.markdown("### 📈 Data Summary")
+        
+        summary_cols = ['quantity', 'price']
+        for col in summary_cols:
+            if col in df.columns:
+                try:
+                    stats = summarize_column(checksum, col, df[col])
+                    col1, col2, col3, col4 = st.columns(4)
+                    col1.metric(f"{col} - Mean", f"{stats['mean']:.2f}")
+                    col2.metric(f"{col} - Median", f"{stats['median']:.2f}")
+                    col3.metric(f"{col} - Min", f"{stats['min']:.2f}")
+                    col4.metric(f"{col} - Max", f"{stats['max']:.2f}")
+                except:
+                    pass
+
+    # ------------------ PAGE 3: Errors ------------------
+    elif page == "❗ Errors":
+        st.markdown('<div class="main-header">', unsafe_allow_html=True)
+        st.markdown("## ❌ Error Analysis")
+        st.markdown("</div>", unsafe_allow_html=True)
+        
+        if invalid_df.empty:
+            st.success("✅ All data is valid! No errors found.")
+        else:
+            # Error summary
+            st.metric("Total Errors Found", len(invalid_df))
+            
+            # Error type filter
+            unique_errors = sorted(
+                invalid_df['error_message'].str.split('; ').explode().unique()
+            )
+            
+            selected_errors = st.multiselect(
+                "Filter by error type:",
+                options=unique_errors,
+                default=unique_errors[:2] if len(unique_errors) > 1 else unique_errors
+            )
+            
+            # Apply filter (single C-level regex scan instead of a Python
+            # callback per row)
+            if selected_errors:
+                pattern = '|'.join(re.escape(err) for err in selected_errors)
+                filtered_df = invalid_df[
+                    invalid_df['error_message'].str.contains(pattern, regex=True, na=False)
+                ]
+            else:
+                filtered_df = invalid_df
+            
+            # Display errors
+            st.dataframe(
+                filtered_df,
+                use_container_width=True,
+                height=400
+            )
+            
+            # Error details
+            st.markdown("---")
+            st.markdown("### 📋 Error Breakdown")
+            
+            # One exploded Series replaces the iterrows + split + dict-per-error
+            # loop; value_counts does the tally in C
+            error_counts = filtered_df['error_message'].str.split('; ').explode().value_counts()
+
+            if not error_counts.empty:
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write("**Error Frequency:**")
+                    for error, count in error_counts.items():
+                        st.write(f"• {error}: {count} times")
+                with col2:
+                    st.write("**Quick Fixes:**")
+                    for error in error_counts.index[:3]:  # Top 3 errors
+                        if "Missing" in error:
+                            st.write(f"• Fill in missing values")
+                        elif "Duplicate" in error:
+                            st.write(f"• Remove duplicate entries")
+                        elif "Invalid date" in error:
+                            st.write(f"• Use dd/mm/yyyy or mm-dd-yyyy format")
+
+    # ------------------ PAGE 4: Export ------------------
+    elif page == "⬇️ Export":
+        st.markdown('<div class="main-header">', unsafe_allow_html=True)
+        st.markdown("## 📥 Export Results")
+        st.markdown("</div>", unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 📁 Export Options")
+            
+            # Format selection
+            export_format = st.radio(
+                "Select format:",
+                ["CSV", "Excel"],
+                horizontal=True
+            )
+            
+            # What to export
+            export_option = st.radio(
+                "Export:",
+                ["All data", "Valid only", "Invalid only"]
+            )
+            
+            # Filter data
+            if export_option == "Valid only":
+                export_df = valid_df
+            elif export_option == "Invalid only":
+                export_df = invalid_df
+            else:
+                export_df = df
+            
+            # File name
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            default_name = f"validated_data_{timestamp}"
+            export_name = st.text_input("File name:", value=default_name)
+        
+        with col2:
+            st.markdown("### 📊 Export Preview")
+            
+            # Preview
+            st.dataframe(export_df.head(5), use_container_width=True)
+            
+            # Stats
+            st.markdown("---")
+            st.markdown("**Export Summary:**")
+            st.write(f"• Rows: {len(export_df)}")
+            st.write(f"• Columns: {len(export_df.columns)}")
+            st.write(f"• Format: {export_format}")
+        
+        # Download buttons
+        st.markdown("---")
+        
+        # Serialization is cached on (file, option, format), so reruns from
+        # widget changes hand a prebuilt bytes object to the download button
+        payload = build_export_payload(checksum, export_option, export_format, export_df)
+
+        if export_format == "CSV":
+            st.download_button(
+                label="📥 Download CSV",
+                data=payload,
+                file_name=f"{export_name}.csv",
+                mime="text/csv",
+                use_container_width=True
+            )
+        else:
+            st.download_button(
+                label="📥 Download Excel",
+                data=payload,
+                file_name=f"{export_name}.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                use_container_width=True
+            )
+        
+        # Additional options
+        with st.expander("⚙️ Advanced Options"):
+            col1, col2 = st.columns(2)
+            with col1:
+                include_status = st.checkbox("Include validation status", value=True)
+                include_errors = st.checkbox("Include error messages", value=True)
+            with col2:
+                st.info("Note: Export may take a moment for large files")
+
+else:
+    # Landing page when no file is uploaded
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown('<div class="main-header">', unsafe_allow_html=True)
+        st.markdown("# 📊 Data Validator Tool")
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Simple instructions
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🚀 How to Use:")
+        st.markdown("""
+        1. **Upload** your CSV/Excel file
+        2. **Preview** your data
+        3. **Analyze** validation results
+        4. **Export** cleaned data
+        """)
+    
+    with col2:
+        st.markdown("### 📋 Requirements:")
+        st.markdown("""
+        Your file must include:
+        - `order_id` (unique)
+        - `date` (dd/mm/yyyy or mm-dd-yyyy)
+        - `item` (text)
+        - `quantity` (number)
+        - `price` (number)
+        """)
+    
+    st.markdown("---")
+    
+    # Quick tips
+    with st.expander("💡 Tips for Best Results"):
+        st.markdown("""
+        - Ensure dates are in correct format
+        - Check for duplicate order IDs
+        - Verify all required fields are filled
+        - Use consistent number formats
+        - Save as CSV for best compatibility
+        """)
+    
+    # Empty state visualization
+    st.markdown("")
+    col1, col2, col3 = st.columns(3)
+    with col2:
         st.info("👈 Upload a file from the sidebar to get started!")
\ No newline at end of file